@@ -0,0 +1,30 @@
+"""Builds the optional Cython Monte Carlo kernel in place.
+
+Usage: python setup.py build_ext --inplace
+"""
+
+import os
+
+import numpy as np
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+numpy_random_lib = os.path.join(np.get_include(), "..", "..", "random", "lib")
+
+setup(
+    name="monte_carlo",
+    package_dir={"": "src"},
+    packages=["monte_carlo"],
+    ext_modules=cythonize(
+        [
+            Extension(
+                "monte_carlo._mc",
+                ["src/monte_carlo/_mc.pyx"],
+                include_dirs=[np.get_include()],
+                library_dirs=[os.path.abspath(numpy_random_lib)],
+                libraries=["npyrandom"],
+                define_macros=[("NPY_NO_DEPRECATED_API", "NPY_1_7_API_VERSION")],
+            )
+        ]
+    ),
+)
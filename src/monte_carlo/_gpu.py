@@ -0,0 +1,40 @@
+"""CuPy Monte Carlo kernel for pricing options on a GPU."""
+
+import cupy as cp
+
+
+def mc_european_gpu(
+    moved_spot, root_variance, discounting, strike, number_of_paths, is_call, seed
+):
+    """
+    Prices a European call or put option with all paths simulated on the GPU.
+
+    Paths are simulated in single precision and the payoffs are summed in double
+    precision.
+
+    Args:
+        moved_spot (float): Spot price moved forward to expiry.
+        root_variance (float): Square root of the integrated variance.
+        discounting (float): Discount factor from expiry.
+        strike (float): Strike price.
+        number_of_paths (int): Number of random paths to generate.
+        is_call (bool): Prices a call if true, a put otherwise.
+        seed (int): Random seed.
+
+    Returns:
+        (float): Resulting option price.
+    """
+    rng = cp.random.default_rng(seed)
+    gaussians = rng.standard_normal(number_of_paths, dtype=cp.float32)
+
+    gaussians *= cp.float32(root_variance)
+    spots = cp.exp(gaussians, out=gaussians)
+    spots *= cp.float32(moved_spot)
+
+    if is_call:
+        pay_offs = cp.subtract(spots, cp.float32(strike), out=spots)
+    else:
+        pay_offs = cp.subtract(cp.float32(strike), spots, out=spots)
+    cp.maximum(pay_offs, 0, out=pay_offs)
+
+    return discounting * float(pay_offs.sum(dtype=cp.float64)) / number_of_paths
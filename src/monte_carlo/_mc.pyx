@@ -0,0 +1,62 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Cython Monte Carlo kernel for pricing options."""
+
+from cpython.pycapsule cimport PyCapsule_GetPointer, PyCapsule_IsValid
+from libc.math cimport exp
+from numpy.random cimport bitgen_t
+from numpy.random.c_distributions cimport random_standard_normal
+
+import numpy as np
+
+
+def european_mc(
+    double moved_spot,
+    double root_variance,
+    double discounting,
+    double strike,
+    long number_of_paths,
+    bint is_call,
+    seed,
+):
+    """
+    Prices a European call or put option in a compiled loop.
+
+    Gaussians are drawn from a PCG64 generator through the NumPy C API, so a seeded
+    run samples the same gaussians as ``numpy.random.default_rng(seed)``.
+
+    Args:
+        moved_spot (float): Spot price moved forward to expiry.
+        root_variance (float): Square root of the integrated variance.
+        discounting (float): Discount factor from expiry.
+        strike (float): Strike price.
+        number_of_paths (int): Number of random paths to generate.
+        is_call (bool): Prices a call if true, a put otherwise.
+        seed (int): Random seed.
+
+    Returns:
+        (float): Resulting option price.
+    """
+    cdef const char *capsule_name = "BitGenerator"
+    cdef bitgen_t *rng
+    cdef double running_sum = 0.0
+    cdef double this_spot
+    cdef double this_payoff
+    cdef long i
+
+    bit_generator = np.random.PCG64(seed)
+    capsule = bit_generator.capsule
+    if not PyCapsule_IsValid(capsule, capsule_name):
+        raise ValueError("Invalid bit generator capsule")
+    rng = <bitgen_t *> PyCapsule_GetPointer(capsule, capsule_name)
+
+    with bit_generator.lock, nogil:
+        for i in range(number_of_paths):
+            this_spot = moved_spot * exp(root_variance * random_standard_normal(rng))
+            if is_call:
+                this_payoff = this_spot - strike
+            else:
+                this_payoff = strike - this_spot
+            if this_payoff > 0:
+                running_sum += this_payoff
+
+    return discounting * running_sum / number_of_paths
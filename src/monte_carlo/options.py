@@ -3,6 +3,40 @@
 import math
 import random
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+try:
+    from scipy.special import ndtri
+    from scipy.stats import qmc
+except ImportError:
+    qmc = None
+
+try:
+    from ._kernels import mc_european
+except ImportError:
+    mc_european = None
+
+try:
+    from ._mc import european_mc
+except ImportError:
+    european_mc = None
+
+try:
+    from ._gpu import mc_european_gpu
+except ImportError:
+    mc_european_gpu = None
 
 from .parameters import ParametersConstant
 from .statistics import ConvergenceTable, StatisticsMean
@@ -13,6 +47,8 @@ class PayOff(ABC):
     Abstract representation for option payoff functions.
     """
 
+    __slots__ = ("strike",)
+
     def __init__(self, strike):
         """
         Initializes a payoff class by defining a strike price.
@@ -37,6 +73,8 @@ class PayOffCall(PayOff):
     Represents a payoff function for a call option.
     """
 
+    __slots__ = ()
+
     def calc(self, spot):
         """
         Calculates a payoff amount for a call option given a spot price.
@@ -55,6 +93,8 @@ class PayOffPut(PayOff):
     Represents a payoff function for a put option.
     """
 
+    __slots__ = ()
+
     def calc(self, spot):
         """
         Calculates a payoff amount for a put option given a spot price.
@@ -73,6 +113,8 @@ class PayOffDoubleDigital(PayOff):
     Represents a payoff function for a double digital option.
     """
 
+    __slots__ = ("lower_level", "upper_level")
+
     def __init__(self, lower_level, upper_level):
         """
         Initializes lower and upper levels for a double digital option.
@@ -109,6 +151,8 @@ class VanillaOption:
     Describes a generic vanilla option (either put or call).
     """
 
+    __slots__ = ("expiry", "pay_off")
+
     def __init__(self, expiry, pay_off):
         """
         Initializes an expiry and a payoff function.
@@ -147,8 +191,47 @@ class Simulation:
     Performs a Monte Carlo simulation for pricing options.
     """
 
+    SAMPLERS = ("prng", "sobol")
+    PRECISIONS = ("fp64", "fp32")
+    CACHE_MAX_BYTES = 2**24
+
+    @staticmethod
+    def terminal_distribution(expiry, spot, vol, r):
+        """
+        Calculates the parameters of the log-normal spot distribution at expiry.
+
+        Args:
+            expiry (float): Expiry.
+            spot (float): Spot price.
+            vol (:obj:`Parameters`): Volatility function.
+            r (:obj:`Parameters`): Interest rate function.
+
+        Returns:
+            (tuple): Spot moved forward to expiry (drift and Ito correction
+                included), square root of the integrated variance and the discount
+                factor from expiry.
+        """
+        variance = vol.integral_square(0, expiry)
+        root_variance = math.sqrt(variance)
+        ito_correction = -0.5 * variance
+        rate_integral = r.integral(0, expiry)
+        moved_spot = spot * math.exp(rate_integral + ito_correction)
+        discounting = math.exp(-rate_integral)
+        return moved_spot, root_variance, discounting
+
     @staticmethod
-    def option_price(option, spot, vol, r, number_of_paths, gatherer, seed):
+    def option_price(
+        option,
+        spot,
+        vol,
+        r,
+        number_of_paths,
+        gatherer,
+        seed,
+        sampler="prng",
+        antithetic=False,
+        precision="fp64",
+    ):
         """
         Calculates an option price by running a Monte Carlo simulation.
 
@@ -160,24 +243,420 @@ class Simulation:
             number_of_paths (int): Number of random paths to generate.
             gatherer (:obj:`MCStatistics`): Interest rate function.
             seed (int): Random seed.
+            sampler (str): Either "prng" for pseudo-random gaussians or "sobol" for
+                a scrambled Sobol' sequence (requires SciPy and a power of two
+                number of paths).
+            antithetic (bool): Pairs every gaussian with its negation and passes
+                the mean payoff of each pair to the gatherer. This halves the
+                variance for monotone payoffs only, so it is applied to call and put
+                payoffs and ignored otherwise. Requires an even number of paths.
+            precision (str): Either "fp64" or "fp32". Single precision halves the
+                memory traffic of the vectorized call and put simulation while the
+                running statistics are still accumulated in double precision. The
+                pure Python loop (no NumPy, or other payoffs) always uses double
+                precision.
 
         Returns:
             (float): Resulting put price.
         """
-        if seed is not None:
-            random.seed(seed)
+        if sampler not in Simulation.SAMPLERS:
+            raise ValueError("Unknown sampler: {}".format(sampler))
 
-        expiry = option.get_expiry()
-        variance = vol.integral_square(0, expiry)
-        root_variance = math.sqrt(variance)
-        ito_correction = -0.5 * variance
-        moved_spot = spot * math.exp(r.integral(0, expiry) + ito_correction)
-        discounting = math.exp(-r.integral(0, expiry))
-        for _ in range(number_of_paths):
-            this_gaussian = random.gauss(0, 1)
-            this_spot = moved_spot * math.exp(root_variance * this_gaussian)
-            this_payoff = option.calc_pay_off(this_spot)
-            gatherer.dump_one_result(discounting * this_payoff)
+        if precision not in Simulation.PRECISIONS:
+            raise ValueError("Unknown precision: {}".format(precision))
+
+        pay_off = option.pay_off
+        is_vanilla = isinstance(pay_off, (PayOffCall, PayOffPut))
+        antithetic = antithetic and is_vanilla
+        if antithetic and number_of_paths % 2:
+            raise ValueError("Antithetic sampling requires an even number of paths")
+
+        moved_spot, root_variance, discounting = Simulation.terminal_distribution(
+            option.get_expiry(), spot, vol, r
+        )
+
+        if np is not None and is_vanilla:
+            Simulation._option_price_vec(
+                option.pay_off,
+                moved_spot,
+                root_variance,
+                discounting,
+                number_of_paths,
+                gatherer,
+                seed,
+                sampler,
+                antithetic,
+                precision,
+            )
+            return
+
+        number_of_draws = number_of_paths // 2 if antithetic else number_of_paths
+        if sampler == "sobol":
+            gaussians = Simulation._sobol_gaussians(number_of_draws, seed).tolist()
+        else:
+            gaussians = Simulation._box_muller_gaussians(
+                number_of_draws, random.Random(seed)
+            )
+
+        exp = math.exp
+        dump_one_result = gatherer.dump_one_result
+
+        if is_vanilla and antithetic:
+            strike = pay_off.strike
+            is_call = isinstance(pay_off, PayOffCall)
+            half_discounting = 0.5 * discounting
+            for this_gaussian in gaussians:
+                pair_payoff = 0.0
+                for this_spot in (
+                    moved_spot * exp(root_variance * this_gaussian),
+                    moved_spot * exp(-root_variance * this_gaussian),
+                ):
+                    this_payoff = this_spot - strike if is_call else strike - this_spot
+                    if this_payoff > 0:
+                        pair_payoff += this_payoff
+                dump_one_result(half_discounting * pair_payoff)
+            return
+
+        if is_vanilla:
+            strike = pay_off.strike
+            is_call = isinstance(pay_off, PayOffCall)
+            for this_gaussian in gaussians:
+                this_spot = moved_spot * exp(root_variance * this_gaussian)
+                this_payoff = this_spot - strike if is_call else strike - this_spot
+                dump_one_result(discounting * this_payoff if this_payoff > 0 else 0.0)
+            return
+
+        calc_pay_off = pay_off.calc
+        for this_gaussian in gaussians:
+            this_spot = moved_spot * exp(root_variance * this_gaussian)
+            this_payoff = calc_pay_off(this_spot)
+            dump_one_result(discounting * this_payoff)
+
+    @staticmethod
+    def _box_muller_gaussians(number_of_paths, rng, batch_size=4096):
+        """
+        Generates gaussians in batches with the Box-Muller transform, without NumPy.
+
+        The uniforms are consumed and transformed exactly as random.gauss does, so
+        a seeded run samples the same gaussians, but each batch is built with list
+        comprehensions instead of one Python call per gaussian.
+
+        Args:
+            number_of_paths (int): Number of gaussians to generate.
+            rng (:obj:`random.Random`): Source of uniforms.
+            batch_size (int): Number of gaussian pairs generated per batch.
+
+        Returns:
+            (iterator[float]): Generated gaussians.
+        """
+        uniform = rng.random
+        cos, sin, sqrt, log = math.cos, math.sin, math.sqrt, math.log
+        two_pi = 2.0 * math.pi
+
+        def batches():
+            for start in range(0, number_of_paths, 2 * batch_size):
+                pairs = min(batch_size, (number_of_paths - start + 1) // 2)
+                uniforms = [uniform() for _ in range(2 * pairs)]
+                angles = [u * two_pi for u in uniforms[0::2]]
+                radii = [sqrt(-2.0 * log(1.0 - u)) for u in uniforms[1::2]]
+
+                gaussians = [0.0] * (2 * pairs)
+                gaussians[0::2] = [cos(a) * r for a, r in zip(angles, radii)]
+                gaussians[1::2] = [sin(a) * r for a, r in zip(angles, radii)]
+                yield gaussians
+
+        return islice(chain.from_iterable(batches()), number_of_paths)
+
+    @staticmethod
+    def _sobol_gaussians(number_of_paths, seed):
+        """
+        Generates gaussians from a scrambled one-dimensional Sobol' sequence through
+        the inverse normal distribution function.
+
+        Args:
+            number_of_paths (int): Number of gaussians to generate, must be a power
+                of two for the sequence to keep its convergence properties.
+            seed (int): Random seed used for scrambling.
+
+        Returns:
+            (:obj:`numpy.ndarray`): Generated gaussians.
+        """
+        if qmc is None:
+            raise ImportError("scipy is required for the Sobol' sampler")
+
+        exponent = number_of_paths.bit_length() - 1
+        if number_of_paths <= 0 or number_of_paths != 1 << exponent:
+            raise ValueError("Sobol' sampler requires a power of two number of paths")
+
+        uniforms = qmc.Sobol(d=1, scramble=True, seed=seed).random_base2(exponent)
+        uniforms = np.clip(
+            uniforms.ravel(), np.finfo(float).tiny, 1 - np.finfo(float).epsneg
+        )
+        return ndtri(uniforms, out=uniforms)
+
+    @staticmethod
+    def _gaussians(number_of_paths, seed, sampler, dtype):
+        """
+        Returns an array of standard normal samples. Samples for an integer seed are
+        identical on every run, so they are cached and shared between runs as long
+        as the array takes less than CACHE_MAX_BYTES (16 MiB, i.e. fewer than 2**21
+        fp64 or 2**22 fp32 paths). Larger arrays are drawn afresh on every run, so
+        the eight cached arrays never hold more than 128 MiB per process.
+
+        Args:
+            number_of_paths (int): Number of gaussians to generate.
+            seed (int): Random seed.
+            sampler (str): Either "prng" or "sobol".
+            dtype (:obj:`numpy.dtype`): Either float64 or float32.
+
+        Returns:
+            (:obj:`numpy.ndarray`): Generated gaussians, read-only when cached.
+        """
+        if (
+            isinstance(seed, int)
+            and number_of_paths * np.dtype(dtype).itemsize < Simulation.CACHE_MAX_BYTES
+        ):
+            return Simulation._cached_gaussians(number_of_paths, seed, sampler, dtype)
+
+        return Simulation._draw_gaussians(number_of_paths, seed, sampler, dtype)
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _cached_gaussians(number_of_paths, seed, sampler, dtype):
+        """
+        Generates an array of standard normal samples and keeps the latest ones in
+        memory.
+
+        Args:
+            number_of_paths (int): Number of gaussians to generate.
+            seed (int): Random seed.
+            sampler (str): Either "prng" or "sobol".
+            dtype (:obj:`numpy.dtype`): Either float64 or float32.
+
+        Returns:
+            (:obj:`numpy.ndarray`): Generated read-only gaussians.
+        """
+        gaussians = Simulation._draw_gaussians(number_of_paths, seed, sampler, dtype)
+        gaussians.setflags(write=False)
+        return gaussians
+
+    @staticmethod
+    def _draw_gaussians(number_of_paths, seed, sampler, dtype):
+        """
+        Generates an array of standard normal samples.
+
+        Args:
+            number_of_paths (int): Number of gaussians to generate.
+            seed (int): Random seed.
+            sampler (str): Either "prng" or "sobol".
+            dtype (:obj:`numpy.dtype`): Either float64 or float32.
+
+        Returns:
+            (:obj:`numpy.ndarray`): Generated gaussians.
+        """
+        if sampler == "sobol":
+            return Simulation._sobol_gaussians(number_of_paths, seed).astype(
+                dtype, copy=False
+            )
+
+        rng = np.random.default_rng(seed)
+        return rng.standard_normal(number_of_paths, dtype=dtype)
+
+    @staticmethod
+    def _discounted_spots(
+        moved_spot,
+        root_variance,
+        discounting,
+        number_of_paths,
+        seed,
+        sampler,
+        antithetic,
+        precision,
+    ):
+        """
+        Simulates discounted spot prices at expiry as a NumPy array.
+
+        Args:
+            moved_spot (float): Spot price moved forward to expiry (drift and Ito
+                correction included).
+            root_variance (float): Square root of the integrated variance.
+            discounting (float): Discount factor from expiry.
+            number_of_paths (int): Number of random paths to generate.
+            seed (int): Random seed.
+            sampler (str): Either "prng" or "sobol".
+            antithetic (bool): Whether to use antithetic variates.
+            precision (str): Either "fp64" or "fp32".
+
+        Returns:
+            (:obj:`numpy.ndarray`): Discounted spots. With antithetic variates the
+                second half of the array holds the antithetic paths.
+        """
+        dtype = np.float32 if precision == "fp32" else np.float64
+        root_variance = dtype(root_variance)
+
+        if antithetic:
+            if number_of_paths % 2:
+                raise ValueError("Antithetic sampling requires an even number of paths")
+
+            half = number_of_paths // 2
+            gaussians = Simulation._gaussians(half, seed, sampler, dtype)
+            spots = np.empty(number_of_paths, dtype=dtype)
+            np.multiply(gaussians, root_variance, out=spots[:half])
+            np.negative(spots[:half], out=spots[half:])
+        else:
+            gaussians = Simulation._gaussians(number_of_paths, seed, sampler, dtype)
+            spots = np.multiply(gaussians, root_variance)
+
+        np.exp(spots, out=spots)
+        spots *= dtype(moved_spot * discounting)
+        return spots
+
+    @staticmethod
+    def _pay_offs_numexpr(
+        pay_off,
+        moved_spot,
+        root_variance,
+        discounting,
+        number_of_paths,
+        seed,
+        sampler,
+        antithetic,
+        precision,
+    ):
+        """
+        Calculates discounted call or put payoffs in a single fused numexpr pass
+        over the gaussians, instead of one NumPy pass per operation.
+
+        The spot is increasing in the gaussian, so the exercise condition S > K is
+        tested as a threshold on the gaussian and the exponential is taken once.
+        On a single thread NumPy's vectorized exp is faster, so this is only used
+        when numexpr runs multi-threaded.
+
+        Args:
+            pay_off (:obj:`PayOff`): Either a call or a put payoff function with a
+                positive strike.
+            moved_spot (float): Spot price moved forward to expiry (drift and Ito
+                correction included).
+            root_variance (float): Square root of the integrated variance, must be
+                positive.
+            discounting (float): Discount factor from expiry.
+            number_of_paths (int): Number of random paths to generate.
+            seed (int): Random seed.
+            sampler (str): Either "prng" or "sobol".
+            antithetic (bool): Whether to use antithetic variates, in which case
+                each result is the sum of the payoffs of a pair.
+            precision (str): Either "fp64" or "fp32".
+
+        Returns:
+            (:obj:`numpy.ndarray`): Discounted payoffs.
+        """
+        dtype = np.float32 if precision == "fp32" else np.float64
+
+        if isinstance(pay_off, PayOffCall):
+            expression = "where({g} > c, s * exp(v * {g}) - k, 0)"
+        else:
+            expression = "where({g} < c, k - s * exp(v * {g}), 0)"
+
+        if antithetic:
+            if number_of_paths % 2:
+                raise ValueError("Antithetic sampling requires an even number of paths")
+
+            number_of_paths //= 2
+            expression = "{} + {}".format(
+                expression.format(g="g"), expression.format(g="(-g)")
+            )
+        else:
+            expression = expression.format(g="g")
+
+        local_dict = {
+            "g": Simulation._gaussians(number_of_paths, seed, sampler, dtype),
+            "c": dtype(math.log(pay_off.strike / moved_spot) / root_variance),
+            "s": dtype(moved_spot * discounting),
+            "k": dtype(pay_off.strike * discounting),
+            "v": dtype(root_variance),
+        }
+        return numexpr.evaluate(expression, local_dict=local_dict)
+
+    @staticmethod
+    def _option_price_vec(
+        pay_off,
+        moved_spot,
+        root_variance,
+        discounting,
+        number_of_paths,
+        gatherer,
+        seed,
+        sampler,
+        antithetic,
+        precision,
+    ):
+        """
+        Runs a Monte Carlo simulation for a call or a put payoff using whole-array
+        NumPy operations instead of a per-path Python loop.
+
+        Args:
+            pay_off (:obj:`PayOff`): Either a call or a put payoff function.
+            moved_spot (float): Spot price moved forward to expiry (drift and Ito
+                correction included).
+            root_variance (float): Square root of the integrated variance.
+            discounting (float): Discount factor from expiry.
+            number_of_paths (int): Number of random paths to generate.
+            gatherer (:obj:`MCStatistics`): Statistics gatherer.
+            seed (int): Random seed.
+            sampler (str): Either "prng" or "sobol".
+            antithetic (bool): Whether to use antithetic variates.
+            precision (str): Either "fp64" or "fp32".
+        """
+        # Discounting both the spot and the strike gives discounted payoffs
+        # directly, max(d * S - d * K, 0) = d * max(S - K, 0), which saves a pass
+        # over the array. Antithetic pairs are averaged the same way.
+        if antithetic:
+            discounting *= 0.5
+
+        if (
+            numexpr is not None
+            and numexpr.get_num_threads() > 1
+            and root_variance > 0
+            and pay_off.strike > 0
+            and moved_spot > 0
+        ):
+            pay_offs = Simulation._pay_offs_numexpr(
+                pay_off,
+                moved_spot,
+                root_variance,
+                discounting,
+                number_of_paths,
+                seed,
+                sampler,
+                antithetic,
+                precision,
+            )
+            gatherer.dump_batch(pay_offs)
+            return
+
+        spots = Simulation._discounted_spots(
+            moved_spot,
+            root_variance,
+            discounting,
+            number_of_paths,
+            seed,
+            sampler,
+            antithetic,
+            precision,
+        )
+        discounted_strike = spots.dtype.type(pay_off.strike * discounting)
+
+        if isinstance(pay_off, PayOffCall):
+            pay_offs = np.subtract(spots, discounted_strike, out=spots)
+        else:
+            pay_offs = np.subtract(discounted_strike, spots, out=spots)
+        np.maximum(pay_offs, 0, out=pay_offs)
+
+        if antithetic:
+            half = number_of_paths // 2
+            pay_offs = np.add(pay_offs[:half], pay_offs[half:], out=pay_offs[:half])
+
+        gatherer.dump_batch(pay_offs)
 
 
 class CalcEuropeanOption:
@@ -185,8 +664,217 @@ class CalcEuropeanOption:
     Calculates a European option using Monte Carlo methods.
     """
 
+    ENGINES = ("numba", "cython", "cupy")
+    GPU_MIN_PATHS = 2**20
+
+    @staticmethod
+    def _normal_cdf(x):
+        """
+        Calculates the standard normal cumulative distribution function.
+
+        Args:
+            x (float): Point at which to evaluate the function.
+
+        Returns:
+            (float): Probability that a standard normal variable is below x.
+        """
+        return 0.5 * math.erfc(-x / math.sqrt(2))
+
+    @staticmethod
+    def _bs_call(spot, strike, expiry, r, vol):
+        """
+        Calculates a European call price using the Black-Scholes formula.
+
+        Args:
+            spot (float): Spot price.
+            strike (float): Strike price.
+            expiry (float): Expiry.
+            r (float): Interest rate.
+            vol (float): Volatility.
+
+        Returns:
+            (float): Resulting call price.
+        """
+        root_variance = vol * math.sqrt(expiry)
+        discounting = math.exp(-r * expiry)
+        if root_variance == 0:
+            return max(spot - strike * discounting, 0.0)
+
+        d1 = (math.log(spot / strike) + (r + 0.5 * vol * vol) * expiry) / root_variance
+        d2 = d1 - root_variance
+        normal_cdf = CalcEuropeanOption._normal_cdf
+        return spot * normal_cdf(d1) - strike * discounting * normal_cdf(d2)
+
+    @staticmethod
+    def _bs_put(spot, strike, expiry, r, vol):
+        """
+        Calculates a European put price using the Black-Scholes formula.
+
+        Args:
+            spot (float): Spot price.
+            strike (float): Strike price.
+            expiry (float): Expiry.
+            r (float): Interest rate.
+            vol (float): Volatility.
+
+        Returns:
+            (float): Resulting put price.
+        """
+        root_variance = vol * math.sqrt(expiry)
+        discounting = math.exp(-r * expiry)
+        if root_variance == 0:
+            return max(strike * discounting - spot, 0.0)
+
+        d1 = (math.log(spot / strike) + (r + 0.5 * vol * vol) * expiry) / root_variance
+        d2 = d1 - root_variance
+        normal_cdf = CalcEuropeanOption._normal_cdf
+        return strike * discounting * normal_cdf(-d2) - spot * normal_cdf(-d1)
+
+    @staticmethod
+    def _kernel_price(
+        pay_off,
+        expiry,
+        spot,
+        vol,
+        r,
+        number_of_paths,
+        seed,
+        engine,
+        sampler,
+        antithetic,
+        precision,
+    ):
+        """
+        Calculates a European option price with a compiled kernel, skipping the
+        convergence statistics.
+
+        Args:
+            pay_off (:obj:`PayOff`): Either a call or a put payoff function.
+            expiry (float): Expiry.
+            spot (float): Spot price.
+            vol (float): Volatility.
+            r (float): Interest rate.
+            number_of_paths (int): Number of paths to calculate.
+            seed (int): Random seed.
+            engine (str): Name of the kernel to use. The "cupy" kernel only runs
+                for at least GPU_MIN_PATHS paths, below which kernel launch and
+                transfer overheads outweigh the GPU and the default simulation is
+                used instead.
+            sampler (str): Must be "prng", compiled kernels draw their own
+                pseudo-random gaussians.
+            antithetic (bool): Must be false.
+            precision (str): Must be "fp64".
+
+        Returns:
+            (float): Resulting option price.
+        """
+        if engine not in CalcEuropeanOption.ENGINES:
+            raise ValueError("Unknown engine: {}".format(engine))
+
+        if sampler != "prng" or antithetic or precision != "fp64":
+            raise ValueError("Compiled engines only support plain fp64 'prng' sampling")
+
+        kernel = {
+            "numba": mc_european,
+            "cython": european_mc,
+            "cupy": mc_european_gpu,
+        }[engine]
+        if kernel is None:
+            raise ImportError("Engine '{}' is not available".format(engine))
+
+        if engine == "cupy" and number_of_paths < CalcEuropeanOption.GPU_MIN_PATHS:
+            gatherer = StatisticsMean()
+            Simulation.option_price(
+                VanillaOption(expiry, pay_off),
+                spot,
+                ParametersConstant(vol),
+                ParametersConstant(r),
+                number_of_paths,
+                gatherer,
+                seed,
+            )
+            return gatherer.get_results_so_far()[0][0]
+
+        moved_spot, root_variance, discounting = Simulation.terminal_distribution(
+            expiry, spot, ParametersConstant(vol), ParametersConstant(r)
+        )
+        return kernel(
+            moved_spot,
+            root_variance,
+            discounting,
+            pay_off.strike,
+            number_of_paths,
+            isinstance(pay_off, PayOffCall),
+            seed,
+        )
+
+    @staticmethod
+    def _price_grid(
+        price,
+        strikes,
+        expiries,
+        spots,
+        vol,
+        r,
+        number_of_paths,
+        seed,
+        max_workers,
+        kwargs,
+    ):
+        """
+        Calculates option prices for a grid of contracts in parallel processes.
+
+        Args:
+            price (callable): Either call_price or put_price.
+            strikes (list[float]): Strike price of every contract.
+            expiries (list[float]): Expiry of every contract.
+            spots (list[float]): Spot price of every contract.
+            vol (float): Volatility.
+            r (float): Interest rate.
+            number_of_paths (int): Number of paths to calculate for each contract.
+            seed (int): Random seed, the i-th contract is priced with seed + i.
+            max_workers (int): Maximum number of processes, defaults to the number
+                of processors.
+            kwargs (dict): Keyword arguments passed on to the pricing function.
+
+        Returns:
+            (list[float]): Resulting prices.
+        """
+        if not len(strikes) == len(expiries) == len(spots):
+            raise ValueError("strikes, expiries and spots must have the same length")
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(
+                    price,
+                    strike,
+                    expiry,
+                    spot,
+                    vol,
+                    r,
+                    number_of_paths,
+                    None if seed is None else seed + i,
+                    **kwargs
+                )
+                for i, (strike, expiry, spot) in enumerate(
+                    zip(strikes, expiries, spots)
+                )
+            ]
+            return [future.result() for future in futures]
+
     @staticmethod
-    def call_price_stats(strike, expiry, spot, vol, r, number_of_paths, seed=None):
+    def call_price_stats(
+        strike,
+        expiry,
+        spot,
+        vol,
+        r,
+        number_of_paths,
+        seed=None,
+        sampler="prng",
+        antithetic=False,
+        precision="fp64",
+    ):
         """
         Calculates a call price for a European option by running a Monte Carlo
         simulation.
@@ -199,6 +887,16 @@ class CalcEuropeanOption:
             r (:obj:`Parameters`): Interest rate function.
             number_of_paths (int): Number of paths to calculate.
             seed (int): Random seed.
+            sampler (str): Either "prng" for pseudo-random gaussians or "sobol" for
+                a scrambled Sobol' sequence (requires SciPy and a power of two
+                number of paths).
+            antithetic (bool): Pairs every gaussian with its negation, which halves
+                the variance of call and put prices. Requires an even number of
+                paths, and statistics are gathered per pair.
+            precision (str): Either "fp64" or "fp32", the latter trades accuracy far
+                below the Monte Carlo error for half the memory traffic. Only the
+                NumPy simulation runs in single precision, the pure Python
+                fallback always uses double precision.
 
         Returns:
             (:obj:`ConvergenceTable`): Returns statistics gathered during
@@ -214,11 +912,27 @@ class CalcEuropeanOption:
             number_of_paths,
             gatherer,
             seed,
+            sampler,
+            antithetic,
+            precision,
         )
         return gatherer
 
     @staticmethod
-    def call_price(strike, expiry, spot, vol, r, number_of_paths, seed=None):
+    def call_price(
+        strike,
+        expiry,
+        spot,
+        vol,
+        r,
+        number_of_paths,
+        seed=None,
+        sampler="prng",
+        antithetic=False,
+        precision="fp64",
+        engine=None,
+        closed_form=False,
+    ):
         """
         Calculates a call price for a European option by running a Monte Carlo
         simulation.
@@ -231,18 +945,71 @@ class CalcEuropeanOption:
             r (:obj:`Parameters`): Interest rate function.
             number_of_paths (int): Number of paths to calculate.
             seed (int): Random seed.
+            sampler (str): Either "prng" for pseudo-random gaussians or "sobol" for
+                a scrambled Sobol' sequence (requires SciPy and a power of two
+                number of paths).
+            antithetic (bool): Pairs every gaussian with its negation, which halves
+                the variance of call and put prices. Requires an even number of
+                paths, and statistics are gathered per pair.
+            precision (str): Either "fp64" or "fp32", the latter trades accuracy far
+                below the Monte Carlo error for half the memory traffic. Only the
+                NumPy simulation runs in single precision, the pure Python
+                fallback always uses double precision.
+            engine (str): Optional compiled kernel to use instead of the default
+                simulation ("numba", "cython" or "cupy" for a GPU). Convergence
+                statistics are not gathered.
+            closed_form (bool): Skips the simulation and returns the exact
+                Black-Scholes price, which exists since vol and r are constant.
 
         Returns:
             (float): Resulting call price.
         """
+        if closed_form:
+            return CalcEuropeanOption._bs_call(spot, strike, expiry, r, vol)
+
+        if engine is not None:
+            return CalcEuropeanOption._kernel_price(
+                PayOffCall(strike),
+                expiry,
+                spot,
+                vol,
+                r,
+                number_of_paths,
+                seed,
+                engine,
+                sampler,
+                antithetic,
+                precision,
+            )
+
         convergence_table = CalcEuropeanOption.call_price_stats(
-            strike, expiry, spot, vol, r, number_of_paths, seed
+            strike,
+            expiry,
+            spot,
+            vol,
+            r,
+            number_of_paths,
+            seed,
+            sampler,
+            antithetic,
+            precision,
         )
         price = convergence_table.get_results_so_far()[-1][0]
         return price
 
     @staticmethod
-    def put_price_stats(strike, expiry, spot, vol, r, number_of_paths, seed=None):
+    def put_price_stats(
+        strike,
+        expiry,
+        spot,
+        vol,
+        r,
+        number_of_paths,
+        seed=None,
+        sampler="prng",
+        antithetic=False,
+        precision="fp64",
+    ):
         """
         Calculates a put price for a European option by running a Monte Carlo
         simulation.
@@ -255,6 +1022,16 @@ class CalcEuropeanOption:
             r (:obj:`Parameters`): Interest rate function.
             number_of_paths (int): Number of paths to calculate.
             seed (int): Random seed.
+            sampler (str): Either "prng" for pseudo-random gaussians or "sobol" for
+                a scrambled Sobol' sequence (requires SciPy and a power of two
+                number of paths).
+            antithetic (bool): Pairs every gaussian with its negation, which halves
+                the variance of call and put prices. Requires an even number of
+                paths, and statistics are gathered per pair.
+            precision (str): Either "fp64" or "fp32", the latter trades accuracy far
+                below the Monte Carlo error for half the memory traffic. Only the
+                NumPy simulation runs in single precision, the pure Python
+                fallback always uses double precision.
 
         Returns:
             (:obj:`ConvergenceTable`): Returns statistics gathered during the Monte
@@ -270,11 +1047,27 @@ class CalcEuropeanOption:
             number_of_paths,
             gatherer,
             seed,
+            sampler,
+            antithetic,
+            precision,
         )
         return gatherer
 
     @staticmethod
-    def put_price(strike, expiry, spot, vol, r, number_of_paths, seed=None):
+    def put_price(
+        strike,
+        expiry,
+        spot,
+        vol,
+        r,
+        number_of_paths,
+        seed=None,
+        sampler="prng",
+        antithetic=False,
+        precision="fp64",
+        engine=None,
+        closed_form=False,
+    ):
         """
         Calculates a put price for a European option by running a Monte Carlo
         simulation.
@@ -287,12 +1080,225 @@ class CalcEuropeanOption:
             r (:obj:`Parameters`): Interest rate function.
             number_of_paths (int): Number of paths to calculate.
             seed (int): Random seed.
+            sampler (str): Either "prng" for pseudo-random gaussians or "sobol" for
+                a scrambled Sobol' sequence (requires SciPy and a power of two
+                number of paths).
+            antithetic (bool): Pairs every gaussian with its negation, which halves
+                the variance of call and put prices. Requires an even number of
+                paths, and statistics are gathered per pair.
+            precision (str): Either "fp64" or "fp32", the latter trades accuracy far
+                below the Monte Carlo error for half the memory traffic. Only the
+                NumPy simulation runs in single precision, the pure Python
+                fallback always uses double precision.
+            engine (str): Optional compiled kernel to use instead of the default
+                simulation ("numba", "cython" or "cupy" for a GPU). Convergence
+                statistics are not gathered.
+            closed_form (bool): Skips the simulation and returns the exact
+                Black-Scholes price, which exists since vol and r are constant.
 
         Returns:
             (float): Resulting put price.
         """
+        if closed_form:
+            return CalcEuropeanOption._bs_put(spot, strike, expiry, r, vol)
+
+        if engine is not None:
+            return CalcEuropeanOption._kernel_price(
+                PayOffPut(strike),
+                expiry,
+                spot,
+                vol,
+                r,
+                number_of_paths,
+                seed,
+                engine,
+                sampler,
+                antithetic,
+                precision,
+            )
+
         convergence_table = CalcEuropeanOption.put_price_stats(
-            strike, expiry, spot, vol, r, number_of_paths, seed
+            strike,
+            expiry,
+            spot,
+            vol,
+            r,
+            number_of_paths,
+            seed,
+            sampler,
+            antithetic,
+            precision,
         )
         price = convergence_table.get_results_so_far()[-1][0]
         return price
+
+    @staticmethod
+    def call_put_price(
+        strike,
+        expiry,
+        spot,
+        vol,
+        r,
+        number_of_paths,
+        seed=None,
+        sampler="prng",
+        antithetic=False,
+        precision="fp64",
+    ):
+        """
+        Calculates both a call and a put price for a European option from a single
+        Monte Carlo simulation.
+
+        Both payoffs are applied to the same simulated spots, so the random numbers
+        and exponentials are only computed once.
+
+        Args:
+            strike (float): Strike price.
+            expiry (float): Expiry.
+            spot (float): Spot price.
+            vol (:obj:`Parameters`): Volatility function.
+            r (:obj:`Parameters`): Interest rate function.
+            number_of_paths (int): Number of paths to calculate.
+            seed (int): Random seed.
+            sampler (str): Either "prng" for pseudo-random gaussians or "sobol" for
+                a scrambled Sobol' sequence (requires SciPy and a power of two
+                number of paths).
+            antithetic (bool): Pairs every gaussian with its negation, which halves
+                the variance of call and put prices. Requires an even number of
+                paths.
+            precision (str): Either "fp64" or "fp32", the latter trades accuracy far
+                below the Monte Carlo error for half the memory traffic. Only the
+                NumPy simulation runs in single precision, the pure Python
+                fallback always uses double precision.
+
+        Returns:
+            (tuple): Resulting call and put prices.
+        """
+        if np is None:
+            args = (strike, expiry, spot, vol, r, number_of_paths, seed, sampler)
+            return (
+                CalcEuropeanOption.call_price(*args, antithetic, precision),
+                CalcEuropeanOption.put_price(*args, antithetic, precision),
+            )
+
+        if sampler not in Simulation.SAMPLERS:
+            raise ValueError("Unknown sampler: {}".format(sampler))
+
+        if precision not in Simulation.PRECISIONS:
+            raise ValueError("Unknown precision: {}".format(precision))
+
+        moved_spot, root_variance, discounting = Simulation.terminal_distribution(
+            expiry, spot, ParametersConstant(vol), ParametersConstant(r)
+        )
+        spots = Simulation._discounted_spots(
+            moved_spot,
+            root_variance,
+            discounting,
+            number_of_paths,
+            seed,
+            sampler,
+            antithetic,
+            precision,
+        )
+        discounted_strike = spots.dtype.type(strike * discounting)
+
+        pay_offs = np.subtract(spots, discounted_strike)
+        np.maximum(pay_offs, 0, out=pay_offs)
+        call = pay_offs.sum(dtype=float) / number_of_paths
+
+        pay_offs = np.subtract(discounted_strike, spots, out=spots)
+        np.maximum(pay_offs, 0, out=pay_offs)
+        put = pay_offs.sum(dtype=float) / number_of_paths
+        return float(call), float(put)
+
+    @staticmethod
+    def call_price_grid(
+        strikes,
+        expiries,
+        spots,
+        vol,
+        r,
+        number_of_paths,
+        seed=None,
+        max_workers=None,
+        **kwargs
+    ):
+        """
+        Calculates call prices for a grid of European options, spreading the
+        contracts across processes. Multi-threaded engines such as "numba" would
+        oversubscribe the cores, so the default simulation is the intended use.
+        Strikes, expiries and spots must have the same length.
+
+        Args:
+            strikes (list[float]): Strike price of every contract.
+            expiries (list[float]): Expiry of every contract.
+            spots (list[float]): Spot price of every contract.
+            vol (float): Volatility.
+            r (float): Interest rate.
+            number_of_paths (int): Number of paths to calculate for each contract.
+            seed (int): Random seed, the i-th contract is priced with seed + i.
+            max_workers (int): Maximum number of processes, defaults to the number
+                of processors.
+            **kwargs: Keyword arguments passed on to call_price.
+
+        Returns:
+            (list[float]): Resulting call prices.
+        """
+        return CalcEuropeanOption._price_grid(
+            CalcEuropeanOption.call_price,
+            strikes,
+            expiries,
+            spots,
+            vol,
+            r,
+            number_of_paths,
+            seed,
+            max_workers,
+            kwargs,
+        )
+
+    @staticmethod
+    def put_price_grid(
+        strikes,
+        expiries,
+        spots,
+        vol,
+        r,
+        number_of_paths,
+        seed=None,
+        max_workers=None,
+        **kwargs
+    ):
+        """
+        Calculates put prices for a grid of European options, spreading the
+        contracts across processes. Multi-threaded engines such as "numba" would
+        oversubscribe the cores, so the default simulation is the intended use.
+        Strikes, expiries and spots must have the same length.
+
+        Args:
+            strikes (list[float]): Strike price of every contract.
+            expiries (list[float]): Expiry of every contract.
+            spots (list[float]): Spot price of every contract.
+            vol (float): Volatility.
+            r (float): Interest rate.
+            number_of_paths (int): Number of paths to calculate for each contract.
+            seed (int): Random seed, the i-th contract is priced with seed + i.
+            max_workers (int): Maximum number of processes, defaults to the number
+                of processors.
+            **kwargs: Keyword arguments passed on to put_price.
+
+        Returns:
+            (list[float]): Resulting put prices.
+        """
+        return CalcEuropeanOption._price_grid(
+            CalcEuropeanOption.put_price,
+            strikes,
+            expiries,
+            spots,
+            vol,
+            r,
+            number_of_paths,
+            seed,
+            max_workers,
+            kwargs,
+        )
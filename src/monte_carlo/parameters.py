@@ -10,6 +10,8 @@ class Parameters(ABC):
     Each parameter is a function (can be constant) of time.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def integral(self, time1, time2):
         """
@@ -43,6 +45,8 @@ class ParametersConstant(Parameters):
     Represents a constant parameter (function).
     """
 
+    __slots__ = ("constant", "constant_square")
+
     def __init__(self, constant) -> None:
         """
         Initializes the class with a constant value.
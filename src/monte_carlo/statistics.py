@@ -21,10 +21,22 @@ class StatisticsMC:
             result (float): Incoming result.
         """
 
+    def dump_batch(self, results):
+        """
+        Computes ongoing statistics based on a batch of incoming results. By default
+        the results are fed one by one to dump_one_result.
+
+        Args:
+            results (:obj:`numpy.ndarray`): Incoming results.
+        """
+        for result in results.tolist():
+            self.dump_one_result(result)
+
     @abstractmethod
     def get_results_so_far(self):
         """
-        Returns statistics accumulated up to this point.
+        Returns statistics accumulated up to this point. The returned arrays may be
+        reused by later calls, so callers must copy rather than modify them.
 
         Returns:
             (array[array[float]]): Computed statistics.
@@ -33,29 +45,82 @@ class StatisticsMC:
 
 class StatisticsMean(StatisticsMC):
     """
-    Computes a running mean of incoming results.
+    Computes a running mean of incoming results together with its standard error.
+
+    The mean and the sum of squared deviations are updated with Welford's
+    recurrence (Chan's formula for batches), which stays accurate for large numbers
+    of paths where a plain running sum loses precision.
     """
 
     def __init__(self):
         """
-        Initializes a running sum and a number of calculated (done) paths.
+        Initializes a running mean, a running sum of squared deviations from the
+        mean, a number of calculated (done) paths, and a buffer for returning
+        results.
         """
-        self.running_sum = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
         self.paths_done = 0
+        self._results = [[0.0, 0.0]]
 
     def dump_one_result(self, result):
         """
-        Given a new result computes a running sum and keeps track of how many paths are
-        calculated to this point.
+        Given a new result updates the running mean and sum of squared deviations and
+        keeps track of how many paths are calculated to this point.
 
         Args:
             result (float): Incoming result.
         """
-        self.running_sum += result
         self.paths_done += 1
+        delta = result - self.mean
+        self.mean += delta / self.paths_done
+        self.m2 += delta * (result - self.mean)
+
+    def dump_batch(self, results):
+        """
+        Given a batch of new results combines its mean and sum of squared deviations
+        with the running ones. The batch is reduced in double precision whatever its
+        type.
+
+        Args:
+            results (:obj:`numpy.ndarray`): Incoming results.
+        """
+        batch_paths = results.size
+        if batch_paths == 0:
+            return
+
+        batch_mean = float(results.mean(dtype=float))
+        batch_m2 = float(results.var(dtype=float)) * batch_paths
+
+        paths_done = self.paths_done + batch_paths
+        delta = batch_mean - self.mean
+        self.mean += delta * batch_paths / paths_done
+        self.m2 += batch_m2 + delta * delta * self.paths_done * batch_paths / paths_done
+        self.paths_done = paths_done
+
+    def get_standard_error(self):
+        """
+        Calculates the standard error of the running mean.
+
+        Returns:
+            (float): Standard error, or NaN before two paths are calculated.
+        """
+        if self.paths_done < 2:
+            return float("nan")
+
+        return math.sqrt(self.m2 / (self.paths_done - 1) / self.paths_done)
 
     def get_results_so_far(self):
-        return [[self.running_sum / self.paths_done]]
+        """
+        Returns the running mean and its standard error, written into a reused
+        buffer.
+
+        Returns:
+            (array[array[float]]): Running mean and its standard error.
+        """
+        self._results[0][0] = self.mean
+        self._results[0][1] = self.get_standard_error()
+        return self._results
 
 
 class ConvergenceTable(StatisticsMC):
@@ -76,6 +141,7 @@ class ConvergenceTable(StatisticsMC):
         self.results_so_far = []
         self.stopping_point = 2
         self.paths_done = 0
+        self.paths_saved = 0
 
     def dump_one_result(self, result):
         """
@@ -90,12 +156,39 @@ class ConvergenceTable(StatisticsMC):
         self.paths_done += 1
 
         if self.paths_done == self.stopping_point:
-            self.stopping_point = math.ceil(self.stopping_point * 2)
+            self._save_results_so_far()
 
-            this_result = self.stats.get_results_so_far()
-            for i in range(len(this_result)):
-                this_result[i].append(self.paths_done)
-                self.results_so_far.append(this_result[i])
+    def dump_batch(self, results):
+        """
+        Given a batch of new results computes running statistics. The batch is split
+        at the pre-defined stopping points, so the underlying statistics are only
+        updated once per stopping point rather than once per result.
+
+        Args:
+            results (:obj:`numpy.ndarray`): Incoming results.
+        """
+        start = 0
+        while start < len(results):
+            end = min(len(results), start + self.stopping_point - self.paths_done)
+            self.stats.dump_batch(results[start:end])
+            self.paths_done += end - start
+
+            if self.paths_done == self.stopping_point:
+                self._save_results_so_far()
+
+            start = end
+
+    def _save_results_so_far(self):
+        """
+        Saves the latest statistics into an array and moves to the next stopping
+        point.
+        """
+        self.stopping_point <<= 1
+        self.paths_saved = self.paths_done
+
+        this_result = self.stats.get_results_so_far()
+        for i in range(len(this_result)):
+            self.results_so_far.append(this_result[i] + [self.paths_done])
 
     def get_results_so_far(self):
         """
@@ -106,10 +199,9 @@ class ConvergenceTable(StatisticsMC):
         """
         tmp = self.results_so_far.copy()
 
-        if self.paths_done != self.stopping_point:
+        if self.paths_done != self.paths_saved:
             this_result = self.stats.get_results_so_far()
             for i in range(len(this_result)):
-                this_result[i].append(self.paths_done)
-                tmp.append(this_result[i])
+                tmp.append(this_result[i] + [self.paths_done])
 
         return tmp
@@ -5,9 +5,31 @@ Usage: test_options.py
 Tests Monte Carlo simulations for pricing options.
 """
 
+import math
+import random
 import unittest
+from unittest import mock
+
+import numpy as np
 
 import monte_carlo.options as options
+from monte_carlo.parameters import ParametersConstant
+from monte_carlo.statistics import ConvergenceTable, StatisticsMC, StatisticsMean
+
+
+class StatisticsCollect(StatisticsMC):
+    """
+    Collects every incoming result, implementing only dump_one_result.
+    """
+
+    def __init__(self):
+        self.results = []
+
+    def dump_one_result(self, result):
+        self.results.append(result)
+
+    def get_results_so_far(self):
+        return [[sum(self.results) / len(self.results)]]
 
 
 class TestMonteCarlo(unittest.TestCase):
@@ -31,7 +53,7 @@ class TestMonteCarlo(unittest.TestCase):
             strike, expiry, spot, vol, r, number_of_paths, seed
         )
         print("Option Call Price (using Monte Carlo) is: {}".format(price))
-        self.assertAlmostEqual(price, 15.195389688817, places=10)
+        self.assertAlmostEqual(price, 15.168182109189683, places=10)
 
         strike = 30
         expiry = 0.25
@@ -42,7 +64,420 @@ class TestMonteCarlo(unittest.TestCase):
             strike, expiry, spot, vol, r, number_of_paths, seed
         )
         print("Option Put Price (using Monte Carlo) is: {}".format(price))
-        self.assertAlmostEqual(price, 1.8925888827916253, places=10)
+        self.assertAlmostEqual(price, 1.8900074726968437, places=10)
+
+    def test_mc_euro_option_call_put(self):
+        """
+        Tests that pricing a call and a put from shared paths matches pricing them
+        separately with the same seed.
+        """
+        number_of_paths = 10000
+        seed = 1234
+
+        call, put = options.CalcEuropeanOption.call_put_price(
+            30, 0.25, 30.14, 0.332, 0.01, number_of_paths, seed
+        )
+        expected_call = options.CalcEuropeanOption.call_price(
+            30, 0.25, 30.14, 0.332, 0.01, number_of_paths, seed
+        )
+        expected_put = options.CalcEuropeanOption.put_price(
+            30, 0.25, 30.14, 0.332, 0.01, number_of_paths, seed
+        )
+        self.assertAlmostEqual(call, expected_call, places=10)
+        self.assertAlmostEqual(put, expected_put, places=10)
+
+        for seed in range(50):
+            call, put = options.CalcEuropeanOption.call_put_price(
+                1, 0.25, 100, 0.2, 0.01, number_of_paths, seed
+            )
+            self.assertEqual(put, 0.0)
+            self.assertAlmostEqual(call, 100 - math.exp(-0.01 * 0.25), delta=1.0)
+
+    def test_mc_euro_option_grid(self):
+        """
+        Tests pricing a grid of contracts in parallel processes.
+        """
+        number_of_paths = 10000
+        seed = 1234
+
+        strikes = [15, 30]
+        expiries = [0.25, 0.5]
+        spots = [30.14, 30.14]
+        prices = options.CalcEuropeanOption.put_price_grid(
+            strikes,
+            expiries,
+            spots,
+            0.332,
+            0.01,
+            number_of_paths,
+            seed,
+            max_workers=2,
+            antithetic=True,
+        )
+
+        self.assertEqual(len(prices), 2)
+        for i, price in enumerate(prices):
+            expected = options.CalcEuropeanOption.put_price(
+                strikes[i],
+                expiries[i],
+                spots[i],
+                0.332,
+                0.01,
+                number_of_paths,
+                seed + i,
+                antithetic=True,
+            )
+            self.assertAlmostEqual(price, expected, places=10)
+
+        with self.assertRaises(ValueError):
+            options.CalcEuropeanOption.call_price_grid(
+                [30, 31, 32], [0.25], [30.14], 0.332, 0.01, number_of_paths, seed
+            )
+
+    def test_mc_euro_option_cached_gaussians(self):
+        """
+        Tests that seeded runs share read-only gaussians and still give the same
+        prices.
+        """
+        gaussians = options.Simulation._gaussians(10000, 1234, "prng", np.float64)
+        self.assertIs(
+            options.Simulation._gaussians(10000, 1234, "prng", np.float64), gaussians
+        )
+        self.assertFalse(gaussians.flags.writeable)
+
+        number_of_paths = options.Simulation.CACHE_MAX_BYTES // 8
+        gaussians = options.Simulation._gaussians(
+            number_of_paths, 1234, "prng", np.float64
+        )
+        self.assertIsNot(
+            options.Simulation._gaussians(number_of_paths, 1234, "prng", np.float64),
+            gaussians,
+        )
+        self.assertTrue(gaussians.flags.writeable)
+
+        prices = [
+            options.CalcEuropeanOption.call_price(
+                15, 0.25, 30.14, 0.332, 0.01, 10000, 1234
+            )
+            for _ in range(2)
+        ]
+        self.assertEqual(prices[0], prices[1])
+
+    def test_mc_euro_option_pure_python(self):
+        """
+        Tests the pure Python Monte Carlo fallback used when NumPy is not available.
+        """
+        number_of_paths = 10000
+        seed = 1234
+
+        with mock.patch.object(options, "np", None):
+            price = options.CalcEuropeanOption.call_price(
+                15, 0.25, 30.14, 0.332, 0.01, number_of_paths, seed
+            )
+            self.assertAlmostEqual(price, 15.195389688817, places=10)
+
+            price = options.CalcEuropeanOption.put_price(
+                30, 0.25, 30.14, 0.332, 0.01, number_of_paths, seed
+            )
+            self.assertAlmostEqual(price, 1.8925888827916253, places=10)
+
+            random.seed(seed)
+            expected = random.random()
+            random.seed(seed)
+            options.CalcEuropeanOption.put_price(
+                30, 0.25, 30.14, 0.332, 0.01, number_of_paths, seed
+            )
+            self.assertEqual(random.random(), expected)
+
+    @unittest.skipIf(options.mc_european is None, "numba is not installed")
+    def test_mc_euro_option_numba(self):
+        """
+        Tests the Numba kernel against the default Monte Carlo simulation.
+        """
+        number_of_paths = 100000
+        seed = 1234
+
+        for price in (
+            options.CalcEuropeanOption.call_price,
+            options.CalcEuropeanOption.put_price,
+        ):
+            expected = price(30, 0.25, 30.14, 0.332, 0.01, number_of_paths, seed)
+            actual = price(
+                30, 0.25, 30.14, 0.332, 0.01, number_of_paths, seed, engine="numba"
+            )
+            self.assertAlmostEqual(actual, expected, delta=0.05)
+
+            repeated = price(
+                30, 0.25, 30.14, 0.332, 0.01, number_of_paths, seed, engine="numba"
+            )
+            self.assertEqual(repeated, actual)
+
+    @unittest.skipIf(options.european_mc is None, "Cython kernel is not built")
+    def test_mc_euro_option_cython(self):
+        """
+        Tests the Cython kernel, which samples the same gaussians as the default
+        Monte Carlo simulation.
+        """
+        number_of_paths = 10000
+        seed = 1234
+
+        for price in (
+            options.CalcEuropeanOption.call_price,
+            options.CalcEuropeanOption.put_price,
+        ):
+            expected = price(30, 0.25, 30.14, 0.332, 0.01, number_of_paths, seed)
+            actual = price(
+                30, 0.25, 30.14, 0.332, 0.01, number_of_paths, seed, engine="cython"
+            )
+            self.assertAlmostEqual(actual, expected, places=10)
+
+    @unittest.skipIf(options.mc_european_gpu is None, "cupy is not installed")
+    def test_mc_euro_option_gpu(self):
+        """
+        Tests the CuPy kernel against the default Monte Carlo simulation.
+        """
+        number_of_paths = options.CalcEuropeanOption.GPU_MIN_PATHS
+        seed = 1234
+
+        expected = options.CalcEuropeanOption.call_price(
+            30, 0.25, 30.14, 0.332, 0.01, number_of_paths, seed
+        )
+        actual = options.CalcEuropeanOption.call_price(
+            30, 0.25, 30.14, 0.332, 0.01, number_of_paths, seed, engine="cupy"
+        )
+        self.assertAlmostEqual(actual, expected, delta=0.02)
+
+    @unittest.skipIf(options.numexpr is None, "numexpr is not installed")
+    def test_mc_euro_option_numexpr(self):
+        """
+        Tests the fused numexpr payoffs against the NumPy ones.
+        """
+        number_of_paths = 10000
+        seed = 1234
+
+        num_threads = options.numexpr.set_num_threads(1)
+        try:
+            for spot in (30.14, 0.0):
+                expected = options.CalcEuropeanOption.put_price(
+                    30, 0.25, spot, 0.332, 0.01, number_of_paths, seed, antithetic=True
+                )
+                options.numexpr.set_num_threads(2)
+                actual = options.CalcEuropeanOption.put_price(
+                    30, 0.25, spot, 0.332, 0.01, number_of_paths, seed, antithetic=True
+                )
+                options.numexpr.set_num_threads(1)
+
+                self.assertAlmostEqual(actual, expected, places=10)
+        finally:
+            options.numexpr.set_num_threads(num_threads)
+
+    def test_mc_euro_option_sobol(self):
+        """
+        Tests quasi Monte Carlo simulations using a Sobol' sequence.
+        """
+        number_of_paths = 2**14
+        seed = 1234
+
+        price = options.CalcEuropeanOption.call_price(
+            30, 0.25, 30.14, 0.332, 0.01, number_of_paths, seed, sampler="sobol"
+        )
+        self.assertAlmostEqual(price, 2.095901164294867, delta=1e-3)
+
+        with self.assertRaises(ValueError):
+            options.CalcEuropeanOption.call_price(
+                30, 0.25, 30.14, 0.332, 0.01, 10000, seed, sampler="sobol"
+            )
+
+    def test_mc_euro_option_antithetic(self):
+        """
+        Tests Monte Carlo simulations using antithetic variates.
+        """
+        number_of_paths = 10000
+        seed = 1234
+
+        stats = options.CalcEuropeanOption.put_price_stats(
+            30, 0.25, 30.14, 0.332, 0.01, number_of_paths, seed, antithetic=True
+        )
+        price, _, paths_done = stats.get_results_so_far()[-1]
+        self.assertAlmostEqual(price, 1.8809948362186706, delta=0.05)
+        self.assertEqual(paths_done, number_of_paths // 2)
+
+        with self.assertRaises(ValueError):
+            options.CalcEuropeanOption.put_price(
+                30, 0.25, 30.14, 0.332, 0.01, 10001, seed, antithetic=True
+            )
+
+        with mock.patch.object(options, "np", None):
+            stats = options.CalcEuropeanOption.put_price_stats(
+                30, 0.25, 30.14, 0.332, 0.01, number_of_paths, seed, antithetic=True
+            )
+            price, _, paths_done = stats.get_results_so_far()[-1]
+            self.assertAlmostEqual(price, 1.8809948362186706, delta=0.05)
+            self.assertEqual(paths_done, number_of_paths // 2)
+
+            with self.assertRaises(ValueError):
+                options.CalcEuropeanOption.put_price(
+                    30, 0.25, 30.14, 0.332, 0.01, 10001, seed, antithetic=True
+                )
+
+    def test_mc_euro_option_fp32(self):
+        """
+        Tests Monte Carlo simulations running in single precision.
+        """
+        number_of_paths = 100000
+        seed = 1234
+
+        price = options.CalcEuropeanOption.call_price(
+            30, 0.25, 30.14, 0.332, 0.01, number_of_paths, seed, precision="fp32"
+        )
+        self.assertIsInstance(price, float)
+        self.assertAlmostEqual(price, 2.095901164294867, delta=0.05)
+
+    def test_euro_option_closed_form(self):
+        """
+        Tests the Black-Scholes prices returned instead of running a simulation.
+        """
+        price = options.CalcEuropeanOption.call_price(
+            30, 0.25, 30.14, 0.332, 0.01, 10000, closed_form=True
+        )
+        self.assertAlmostEqual(price, 2.095901164294867, places=10)
+
+        price = options.CalcEuropeanOption.put_price(
+            30, 0.25, 30.14, 0.332, 0.01, 10000, closed_form=True
+        )
+        self.assertAlmostEqual(price, 1.8809948362186706, places=10)
+
+    def test_euro_option_closed_form_zero_variance(self):
+        """
+        Tests that the Black-Scholes prices fall back to the discounted intrinsic
+        value when there is no variance left.
+        """
+        price = options.CalcEuropeanOption.call_price(
+            30, 0, 30.14, 0.332, 0.01, 100, closed_form=True
+        )
+        self.assertAlmostEqual(price, 0.14, places=10)
+
+        price = options.CalcEuropeanOption.put_price(
+            30, 0, 30.14, 0.332, 0.01, 100, closed_form=True
+        )
+        self.assertEqual(price, 0.0)
+
+        price = options.CalcEuropeanOption.call_price(
+            30, 0.25, 30.14, 0, 0.01, 100, closed_form=True
+        )
+        self.assertAlmostEqual(price, 30.14 - 30 * math.exp(-0.01 * 0.25), places=10)
+
+        price = options.CalcEuropeanOption.put_price(
+            31, 0.25, 30.14, 0, 0.01, 100, closed_form=True
+        )
+        self.assertAlmostEqual(price, 31 * math.exp(-0.01 * 0.25) - 30.14, places=10)
+
+    def test_mc_double_digital_option(self):
+        """
+        Tests Monte Carlo simulations for a double digital option, which is priced
+        path by path.
+        """
+        spot = 30.14
+        expiry = 0.25
+        vol = 0.332
+        r = 0.01
+
+        gatherer = StatisticsMean()
+        options.Simulation.option_price(
+            options.VanillaOption(expiry, options.PayOffDoubleDigital(25, 35)),
+            spot,
+            ParametersConstant(vol),
+            ParametersConstant(r),
+            10000,
+            gatherer,
+            1234,
+        )
+
+        def probability_above(level):
+            root_variance = vol * math.sqrt(expiry)
+            d2 = (
+                math.log(spot / level) + (r - 0.5 * vol * vol) * expiry
+            ) / root_variance
+            return 0.5 * math.erfc(-d2 / math.sqrt(2))
+
+        expected = math.exp(-r * expiry) * (
+            probability_above(25) - probability_above(35)
+        )
+        self.assertAlmostEqual(
+            gatherer.get_results_so_far()[0][0], expected, delta=0.02
+        )
+
+    def test_mc_euro_option_one_result_gatherer(self):
+        """
+        Tests that gatherers implementing only dump_one_result receive every result
+        of a vectorized simulation, directly and through a convergence table.
+        """
+        number_of_paths = 1000
+        option = options.VanillaOption(0.25, options.PayOffCall(30))
+
+        stats = StatisticsCollect()
+        options.Simulation.option_price(
+            option,
+            30.14,
+            ParametersConstant(0.332),
+            ParametersConstant(0.01),
+            number_of_paths,
+            stats,
+            1234,
+        )
+        self.assertEqual(len(stats.results), number_of_paths)
+
+        stats = StatisticsCollect()
+        table = ConvergenceTable(stats)
+        options.Simulation.option_price(
+            option,
+            30.14,
+            ParametersConstant(0.332),
+            ParametersConstant(0.01),
+            number_of_paths,
+            table,
+            1234,
+        )
+        self.assertEqual(len(stats.results), number_of_paths)
+        self.assertEqual(table.get_results_so_far()[-1][-1], number_of_paths)
+
+    def test_convergence_table_batch(self):
+        """
+        Tests that batched results are saved at the same stopping points as results
+        fed one by one.
+        """
+        results = np.random.default_rng(1234).standard_normal(1000)
+
+        one_by_one = ConvergenceTable(StatisticsMean())
+        for result in results:
+            one_by_one.dump_one_result(result)
+
+        batched = ConvergenceTable(StatisticsMean())
+        batched.dump_batch(results[:100])
+        batched.dump_batch(results[100:])
+
+        expected = one_by_one.get_results_so_far()
+        actual = batched.get_results_so_far()
+        self.assertEqual([row[-1] for row in actual], [row[-1] for row in expected])
+        for actual_row, expected_row in zip(actual, expected):
+            self.assertAlmostEqual(actual_row[0], expected_row[0], places=12)
+            self.assertAlmostEqual(actual_row[1], expected_row[1], places=12)
+
+    def test_convergence_table_stopping_point(self):
+        """
+        Tests that the results are not duplicated when the last path falls on a
+        stopping point.
+        """
+        table = ConvergenceTable(StatisticsMean())
+        self.assertEqual(table.get_results_so_far(), [])
+
+        for result in range(8):
+            table.dump_one_result(float(result))
+
+        results = table.get_results_so_far()
+        self.assertEqual([row[-1] for row in results], [2, 4, 8])
+        self.assertEqual([row[0] for row in results], [0.5, 1.5, 3.5])
+        self.assertAlmostEqual(results[-1][1], math.sqrt(6 / 8))
 
 
 if __name__ == "__main__":